@@ -1,31 +1,8 @@
-from dataclasses import dataclass
-from typing import Dict, List, Set, Tuple
+from array import array
+from typing import Callable, List, Tuple
+import functools
 import heapq
 
-@dataclass
-class Node:
-    """
-    Node in the search space with position and cost information.
-
-    Attributes:
-        position: (x, y) tuple representing position
-        g_cost: Cost from start to current node
-        h_cost: Estimated cost from current node to goal
-        parent: Reference to parent node
-    """
-    position: Tuple[int, int]
-    g_cost: float
-    h_cost: float
-    parent: 'Node' = None
-
-    @property
-    def f_cost(self) -> float:
-        """Total estimated cost of path through this node."""
-        return self.g_cost + self.h_cost
-
-    def __lt__(self, other):
-        return self.f_cost < other.f_cost
-
 def a_star_search(grid: List[List[int]], start: Tuple[int, int], 
                   goal: Tuple[int, int]) -> List[Tuple[int, int]]:
     """
@@ -45,53 +22,91 @@ def a_star_search(grid: List[List[int]], start: Tuple[int, int],
     Example:
         >>> grid = [[0,0,0], [0,1,0], [0,0,0]]
         >>> a_star_search(grid, (0,0), (2,2))
-        [(0,0), (0,1), (1,2), (2,2)]
+        [(0, 0), (0, 1), (0, 2), (1, 2), (2, 2)]
     """
-    def heuristic(pos: Tuple[int, int]) -> float:
-        """Manhattan distance heuristic."""
-        return abs(pos[0] - goal[0]) + abs(pos[1] - goal[1])
-
-    def get_neighbors(pos: Tuple[int, int]) -> List[Tuple[int, int]]:
-        """Get valid neighboring positions."""
-        directions = [(0,1), (1,0), (0,-1), (-1,0)]
-        neighbors = []
-        for dx, dy in directions:
-            new_x, new_y = pos[0] + dx, pos[1] + dy
-            if (0 <= new_x < len(grid) and 
-                0 <= new_y < len(grid[0]) and 
-                grid[new_x][new_y] == 0):
-                neighbors.append((new_x, new_y))
-        return neighbors
-
-    open_set = []
-    closed_set = set()
-    
-    start_node = Node(start, 0, heuristic(start))
-    heapq.heappush(open_set, start_node)
-    
+    if not grid or not grid[0]:
+        return []
+
+    rows, cols = len(grid), len(grid[0])
+    # Flatten the grid once so the search loop never touches nested lists
+    cells = bytearray(cell != 0 for row in grid for cell in row)
+
+    kernel = _compile_kernel(rows, cols)
+    flat_path = kernel(cells, start[0], start[1], goal[0], goal[1])
+    return [divmod(index, cols) for index in reversed(flat_path)]
+
+# Source of the A* expansion loop on a flattened grid. Everything in here is
+# plain integers: positions are flat indices (x * cols + y), costs and parents
+# live in preallocated arrays and the open set holds (f_cost, g_cost, index)
+# tuples, so no per-node objects are built while searching. The grid shape is
+# filled in by _compile_kernel so bounds checks compare against constants.
+_KERNEL_SOURCE = """
+def a_star_kernel(cells, sx, sy, gx, gy):
+    start = sx * {cols} + sy
+    goal = gx * {cols} + gy
+
+    best_g = array('q', [-1]) * {size}
+    parent = array('q', [-1]) * {size}
+    closed = bytearray({size})
+
+    best_g[start] = 0
+    open_set = [(abs(sx - gx) + abs(sy - gy), 0, start)]
+
     while open_set:
-        current = heapq.heappop(open_set)
-        
-        if current.position == goal:
-            path = []
-            while current:
-                path.append(current.position)
-                current = current.parent
-            return path[::-1]
-            
-        closed_set.add(current.position)
-        
-        for neighbor_pos in get_neighbors(current.position):
-            if neighbor_pos in closed_set:
-                continue
-                
-            g_cost = current.g_cost + 1
-            neighbor = Node(neighbor_pos, g_cost, heuristic(neighbor_pos), current)
-            
-            if neighbor not in open_set:
-                heapq.heappush(open_set, neighbor)
-                
-    return []
+        _, g_cost, current = heappop(open_set)
+
+        if current == goal:
+            path = array('q')
+            while current != -1:
+                path.append(current)
+                current = parent[current]
+            return path
+
+        if closed[current]:
+            continue  # Stale entry, a cheaper copy was already expanded
+        closed[current] = 1
+
+        x, y = divmod(current, {cols})
+        g_cost += 1
+        for neighbor, nx, ny in ((current + 1, x, y + 1), (current + {cols}, x + 1, y),
+                                 (current - 1, x, y - 1), (current - {cols}, x - 1, y)):
+            if 0 <= nx < {rows} and 0 <= ny < {cols}:
+                if cells[neighbor] or closed[neighbor]:
+                    continue
+                if best_g[neighbor] == -1 or g_cost < best_g[neighbor]:
+                    best_g[neighbor] = g_cost
+                    parent[neighbor] = current
+                    f_cost = g_cost + abs(nx - gx) + abs(ny - gy)
+                    heappush(open_set, (f_cost, g_cost, neighbor))
+
+    return array('q')
+"""
+
+@functools.lru_cache(maxsize=32)
+def _compile_kernel(rows: int, cols: int) -> Callable:
+    """
+    Build an A* kernel specialized for one grid shape.
+
+    The shape is baked into the generated source, so the bounds test and the
+    flat index math use constants instead of variable lookups. Kernels are
+    cached per (rows, cols), so a game searching the same map over and over
+    only pays for the exec once.
+
+    Args:
+        rows: Number of rows in the grid
+        cols: Number of columns in the grid
+
+    Returns:
+        Callable: kernel(cells, sx, sy, gx, gy) returning the flat indices of
+                  the path from goal back to start, empty if no path found
+
+    Time Complexity: O(E log V) per search where V is number of cells and E is edges
+    Space Complexity: O(V) for the cost, parent and closed arrays
+    """
+    namespace = {'array': array, 'heappop': heapq.heappop, 'heappush': heapq.heappush}
+    source = _KERNEL_SOURCE.format(rows=rows, cols=cols, size=rows * cols)
+    exec(compile(source, f'<a_star_kernel {rows}x{cols}>', 'exec'), namespace)
+    return namespace['a_star_kernel']
 
 if __name__ == "__main__":
     test_grid = [
@@ -1,26 +1,120 @@
-def build_bad_char_table(pattern: str) -> dict:
+# Code points below this get a slot in the dense part of the bad character table
+DENSE_TABLE_SIZE = 256
+
+def build_bad_char_table(pattern: str) -> tuple:
     """
     Build the bad character table for Boyer-Moore algorithm.
 
+    For every character the table holds how far its rightmost occurrence
+    (ignoring the last pattern character) sits from the end of the pattern;
+    characters that never show up get the full pattern length. Code points
+    below 256 live in a fixed 256-entry list, so the common case is a cheap
+    list lookup. The few wider characters the pattern actually contains go
+    into a small dict, so one emoji doesn't blow the list up to 128k slots.
+
     Args:
         pattern (str): Pattern to analyze
 
     Returns:
-        dict: Table of rightmost occurrences of each character
+        tuple: (list of 256 shifts, dict of shifts for code points >= 256)
 
-    Time Complexity: O(m + k) where m is pattern length, k is alphabet size
-    Space Complexity: O(k)
+    Time Complexity: O(m) where m is pattern length
+    Space Complexity: O(m), the list being a fixed 256 entries
     """
-    # Dictionary to store the last occurrence of each character
-    # (like a character's favorite parking spot)
-    table = {}
-    
-    for i in range(len(pattern)):
-        table[pattern[i]] = i
-        
-    return table
+    m = len(pattern)
+    # Everything defaults to a full jump (like a character with no parking spot)
+    table = [m] * DENSE_TABLE_SIZE
+    wide = {}
+
+    for i in range(m - 1):
+        code = ord(pattern[i])
+        if code < DENSE_TABLE_SIZE:
+            table[code] = m - 1 - i
+        else:
+            wide[code] = m - 1 - i
+
+    return table, wide
+
+def build_good_suffix_table(pattern: str) -> list:
+    """
+    Build the (strong) good suffix table for Boyer-Moore algorithm.
+
+    Uses the classic two pass construction: the first pass walks the borders
+    of every suffix to find where a matched suffix reappears in the pattern,
+    the second fills the remaining slots from the widest border of the whole
+    pattern.
+
+    Args:
+        pattern (str): Pattern to analyze
+
+    Returns:
+        list: Table of length m + 1 where entry j + 1 is the shift after a
+              mismatch at pattern index j and entry 0 is the shift after a
+              full match
+
+    Time Complexity: O(m) where m is pattern length
+    Space Complexity: O(m)
+    """
+    m = len(pattern)
+    shift = [0] * (m + 1)
+    border = [0] * (m + 1)
+
+    # Pass 1: suffixes that reappear somewhere else in the pattern
+    i, j = m, m + 1
+    border[i] = j
+    while i > 0:
+        while j <= m and pattern[i - 1] != pattern[j - 1]:
+            if shift[j] == 0:
+                shift[j] = j - i
+            j = border[j]
+        i -= 1
+        j -= 1
+        border[i] = j
+
+    # Pass 2: only a prefix of the pattern matches part of the suffix
+    j = border[0]
+    for i in range(m + 1):
+        if shift[i] == 0:
+            shift[i] = j
+        if i == j:
+            j = border[j]
+
+    return shift
 
 def boyer_moore_search(text: str, pattern: str) -> list:
+    """
+    Find every occurrence of pattern in text.
+
+    The skipping is left to str.find, whose C implementation already does
+    Boyer-Moore-style jumps (two-way + memchr) faster than any Python loop
+    could. The hand-written algorithm is kept as boyer_moore_search_classic.
+
+    Args:
+        text (str): Text to search in
+        pattern (str): Pattern to search for
+
+    Returns:
+        list: List of starting indices where pattern is found
+
+    Time Complexity: O(n + m) on average, done in C
+    Space Complexity: O(1) besides the result list
+
+    Example:
+        >>> boyer_moore_search("WHICH-FINALLY-HALTS.--AT-THAT-POINT", "AT")
+        [22, 27]
+    """
+    matches = []
+    if not pattern or not text:
+        return matches
+
+    i = text.find(pattern)
+    while i != -1:
+        matches.append(i)
+        i = text.find(pattern, i + 1)  # i + 1 keeps overlapping matches
+
+    return matches
+
+def boyer_moore_search_classic(text: str, pattern: str) -> list:
     """
     Perform Boyer-Moore pattern searching algorithm.
 
@@ -34,20 +128,21 @@ def boyer_moore_search(text: str, pattern: str) -> list:
     Time Complexity:
         - Best Case: O(n/m)
         - Average Case: O(n)
-        - Worst Case: O(nm)
-    Space Complexity: O(k) where k is alphabet size
+        - Worst Case: O(n + m) without matches thanks to the good suffix rule, O(nm) with many
+    Space Complexity: O(m) (plus a fixed 256-entry table)
 
     Example:
-        >>> boyer_moore_search("WHICH-FINALLY-HALTS.--AT-THAT-POINT", "AT")
-        [14, 23]
+        >>> boyer_moore_search_classic("WHICH-FINALLY-HALTS.--AT-THAT-POINT", "AT")
+        [22, 27]
     """
     matches = []
     if not pattern or not text:
         return matches
 
-    # Build the bad character table (our cheat sheet)
-    bad_char = build_bad_char_table(pattern)
-    
+    # Build the shift tables (our cheat sheets)
+    bad_char, wide_bad_char = build_bad_char_table(pattern)
+    good_suffix = build_good_suffix_table(pattern)
+
     m = len(pattern)
     n = len(text)
     i = m - 1  # Start at the end, because we're rebels
@@ -64,12 +159,15 @@ def boyer_moore_search(text: str, pattern: str) -> list:
         if j < 0:
             # Found a match! Time to celebrate
             matches.append(k + 1)
-            i += 1
+            i += good_suffix[0]
         else:
-            # Character mismatch, time to make a big jump
-            char = text[k]
-            skip = j - bad_char.get(char, -1)
-            i += max(1, skip)
+            # Character mismatch, take whichever rule jumps further
+            code = ord(text[k])
+            if code < DENSE_TABLE_SIZE:
+                bad_shift = bad_char[code] - (m - 1 - j)
+            else:
+                bad_shift = wide_bad_char.get(code, m) - (m - 1 - j)
+            i += max(bad_shift, good_suffix[j + 1])
 
     return matches
 
@@ -79,6 +177,7 @@ if __name__ == "__main__":
     
     result = boyer_moore_search(text, pattern)
     print(f"Pattern found at indices: {result}")
+    print(f"Classic version agrees: {boyer_moore_search_classic(text, pattern) == result}")
     
     # Edge cases (because we're responsible developers)
     print("\nTesting edge cases:")
@@ -13,7 +13,7 @@ def breadth_first_search(graph: dict, start: str, target: str) -> list:
         list: Shortest path from start to target if found, empty list otherwise
 
     Time Complexity: O(V + E) where V is vertices and E is edges
-    Space Complexity: O(V) for the queue and visited set
+    Space Complexity: O(V) for the queue and parent map
 
     Example:
         >>> graph = {
@@ -30,25 +30,157 @@ def breadth_first_search(graph: dict, start: str, target: str) -> list:
     if start not in graph:
         return []
 
-    queue = deque([[start]])
-    visited = {start}
+    queue = deque([start])
+    # Each discovered vertex remembers who found it, which doubles as the visited set
+    parent = {start: None}
 
     while queue:
-        path = queue.popleft()
-        vertex = path[-1]
+        vertex = queue.popleft()
 
         if vertex == target:
-            return path
+            path = []
+            while vertex is not None:
+                path.append(vertex)
+                vertex = parent[vertex]
+            return path[::-1]
 
         for neighbor in graph[vertex]:
-            if neighbor not in visited:
-                visited.add(neighbor)
-                new_path = list(path)
-                new_path.append(neighbor)
-                queue.append(new_path)
+            if neighbor not in parent:
+                parent[neighbor] = vertex
+                queue.append(neighbor)
 
     return []
 
+def build_reverse_graph(graph: dict) -> dict:
+    """
+    Build the reversed adjacency lists needed by bidirectional_search.
+
+    Every edge u -> v becomes v -> u. Build it once per graph and pass it
+    to as many bidirectional_search calls as you like.
+
+    Args:
+        graph (dict): Dictionary of vertices to lists of adjacent vertices
+
+    Returns:
+        dict: Reversed graph in the same format
+
+    Time Complexity: O(V + E)
+    Space Complexity: O(V + E)
+
+    Example:
+        >>> build_reverse_graph({'A': ['B'], 'B': ['C'], 'C': []})
+        {'B': ['A'], 'C': ['B']}
+    """
+    reverse_graph = {}
+    for vertex, neighbors in graph.items():
+        for neighbor in neighbors:
+            reverse_graph.setdefault(neighbor, []).append(vertex)
+    return reverse_graph
+
+def bidirectional_search(graph: dict, reverse_graph: dict, start: str, target: str) -> list:
+    """
+    Find a shortest path by searching from both ends until the frontiers meet.
+
+    Visits roughly 2 * b^(d/2) vertices instead of b^d (b being the
+    branching factor and d the path length). The search from the target
+    walks edges backwards through reverse_graph, so directed graphs work
+    as well as undirected ones.
+
+    Args:
+        graph (dict): Dictionary of vertices to lists of adjacent vertices
+        reverse_graph (dict): build_reverse_graph(graph), built once up front
+        start (str): Starting vertex
+        target (str): Target vertex to find
+
+    Returns:
+        list: Shortest path from start to target if found, empty list otherwise
+
+    Time Complexity: O(V + E) worst case, usually far less on long paths
+    Space Complexity: O(V) for the frontiers and parent maps
+
+    Example:
+        >>> graph = {'A': ['B', 'X'], 'X': [], 'B': ['C'], 'C': []}
+        >>> bidirectional_search(graph, build_reverse_graph(graph), 'A', 'C')
+        ['A', 'B', 'C']
+    """
+    if start not in graph:
+        return []
+    if start == target:
+        return [start]
+
+    # Two searches, one from each end, meeting in the middle. Each parent map
+    # doubles as that side's visited set.
+    parent_start = {start: None}
+    parent_target = {target: None}
+    frontier_start = [start]
+    frontier_target = [target]
+
+    while frontier_start and frontier_target:
+        # Grow whichever side is cheaper to expand by one full level
+        if len(frontier_start) <= len(frontier_target):
+            frontier_start, meet = _expand_level(graph, frontier_start, parent_start, parent_target)
+        else:
+            frontier_target, meet = _expand_level(reverse_graph, frontier_target, parent_target, parent_start)
+
+        if meet is not None:
+            return _stitch_path(meet, parent_start, parent_target)
+
+    return []
+
+def _expand_level(graph: dict, frontier: list, parent: dict, other_parent: dict) -> tuple:
+    """
+    Expand one BFS level of one side of the bidirectional search.
+
+    Args:
+        graph (dict): Adjacency lists to follow (the reversed graph for the target side)
+        frontier (list): Vertices of the current level on this side
+        parent (dict): Parent map of this side, updated in place
+        other_parent (dict): Parent map of the opposite side
+
+    Returns:
+        tuple: (next level, meeting vertex or None)
+
+    Time Complexity: O(edges leaving the frontier)
+    Space Complexity: O(size of the next level)
+    """
+    next_frontier = []
+    for vertex in frontier:
+        for neighbor in graph.get(vertex, ()):
+            if neighbor not in parent:
+                parent[neighbor] = vertex
+                if neighbor in other_parent:
+                    return next_frontier, neighbor
+                next_frontier.append(neighbor)
+    return next_frontier, None
+
+def _stitch_path(meet: str, parent_start: dict, parent_target: dict) -> list:
+    """
+    Join the two half paths that meet at a common vertex.
+
+    Args:
+        meet (str): Vertex reached by both searches
+        parent_start (dict): Parent map of the search from start
+        parent_target (dict): Parent map of the search from target
+
+    Returns:
+        list: Path from start to target through meet
+
+    Time Complexity: O(path length)
+    Space Complexity: O(path length)
+    """
+    path = []
+    vertex = meet
+    while vertex is not None:
+        path.append(vertex)
+        vertex = parent_start[vertex]
+    path.reverse()
+
+    vertex = parent_target[meet]
+    while vertex is not None:
+        path.append(vertex)
+        vertex = parent_target[vertex]
+    return path
+
 def verify_search(graph: dict, start: str, target: str) -> None:
     """
     Verify if the search function works correctly.
@@ -83,3 +215,9 @@ if __name__ == "__main__":
     single_node = {'A': []}
     verify_search(single_node, 'A', 'A')
     verify_search(test_graph, 'A', 'Z')  # Non-existent target
+
+    # Directed graph, searched from both ends with a reverse index built once
+    directed_graph = {'A': ['B', 'X'], 'X': [], 'B': ['C'], 'C': []}
+    reverse_graph = build_reverse_graph(directed_graph)
+    print("Bidirectional A -> C:", bidirectional_search(directed_graph, reverse_graph, 'A', 'C'))
+    print("Bidirectional C -> A:", bidirectional_search(directed_graph, reverse_graph, 'C', 'A'))
@@ -11,7 +11,7 @@ def depth_first_search(graph: dict, start: str, target: str) -> list:
         list: Path from start to target if found, empty list otherwise
 
     Time Complexity: O(V + E) where V is vertices and E is edges
-    Space Complexity: O(V) for the visited set and recursion stack
+    Space Complexity: O(V) for the visited set and explicit stack
 
     Example:
         >>> graph = {
@@ -25,24 +25,33 @@ def depth_first_search(graph: dict, start: str, target: str) -> list:
         >>> depth_first_search(graph, 'A', 'F')
         ['A', 'C', 'F']
     """
-    def dfs_recursive(vertex, visited, path):
-        visited.add(vertex)
-        path.append(vertex)
+    path = [start]
+    if start == target:
+        return path
 
-        if vertex == target:
-            return True
+    # Explicit stack of neighbor iterators, one per vertex on the current path,
+    # so deep graphs don't run into the recursion limit
+    visited = {start}
+    stack = [iter(graph[start])]
 
-        for neighbor in graph[vertex]:
-            if neighbor not in visited:
-                if dfs_recursive(neighbor, visited, path):
-                    return True
+    while stack:
+        try:
+            neighbor = next(stack[-1])
+        except StopIteration:
+            # Dead end, backtrack
+            stack.pop()
+            path.pop()
+            continue
 
-        path.pop()
-        return False
+        if neighbor in visited:
+            continue
+
+        visited.add(neighbor)
+        path.append(neighbor)
+        if neighbor == target:
+            return path
+        stack.append(iter(graph[neighbor]))
 
-    visited = set()
-    path = []
-    dfs_recursive(start, visited, path)
     return path
 
 def verify_search(graph: dict, start: str, target: str) -> None:
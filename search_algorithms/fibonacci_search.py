@@ -1,9 +1,12 @@
+from array import array
+
 def fibonacci_search(arr: list, target: int) -> int:
     """
     Perform fibonacci search to find the index of a target element.
 
     Args:
-        arr (list): Sorted list to search through
+        arr (list): Sorted list to search through, an array.array('q')
+            works as well and stores 8 bytes per element instead of a PyLong each
         target (int): Element to find
 
     Returns:
@@ -19,12 +22,14 @@ def fibonacci_search(arr: list, target: int) -> int:
     if not arr:
         return -1
 
+    last = len(arr) - 1  # Hoisted, the loop below never changes the length
+
     fib2 = 0  
     fib1 = 1  
     fib = fib1 + fib2 
 
     # smallest Fibonacci number greater than or equal to len(arr)
-    while fib < len(arr):
+    while fib <= last:
         fib2 = fib1
         fib1 = fib
         fib = fib1 + fib2
@@ -33,7 +38,9 @@ def fibonacci_search(arr: list, target: int) -> int:
 
     while fib > 1:
         # Check if fib2 is a valid location or an imaginary place
-        i = min(offset + fib2, len(arr) - 1)
+        i = offset + fib2
+        if i > last:
+            i = last
 
         if arr[i] < target:
             fib = fib1
@@ -47,7 +54,7 @@ def fibonacci_search(arr: list, target: int) -> int:
         else:
             return i
 
-    if fib1 and offset < len(arr) - 1 and arr[offset + 1] == target:
+    if fib1 and offset < last and arr[offset + 1] == target:
         return offset + 1
 
     return -1
@@ -80,3 +87,4 @@ if __name__ == "__main__":
     verify_search(test_list, 12)  
     verify_search(test_list, 1) 
     verify_search(test_list, 11) 
+    verify_search(array('q', test_list), 7)
@@ -1,6 +1,9 @@
 from typing import Optional
 
 class ListNode:
+    # No per-node __dict__, which keeps long lists compact for the pointer chase
+    __slots__ = ('value', 'next')
+
     def __init__(self, value: int, next: Optional['ListNode'] = None):
         """Initialize a node with a value and a pointer to the next node."""
         self.value = value
@@ -20,22 +20,30 @@ def interpolation_search(arr: list, target: int) -> int:
     """
     low = 0
     high = len(arr) - 1
+    if high < 0:
+        return -1
 
-    while low <= high and target >= arr[low] and target <= arr[high]:
-        if low == high:
-            if arr[low] == target:
-                return low
-            return -1
+    # Keep the boundary values in locals, they only change when low/high move
+    low_value = arr[low]
+    high_value = arr[high]
 
-        pos = low + ((high - low) * (target - arr[low]) // 
-                    (arr[high] - arr[low]))
+    while low <= high and low_value <= target <= high_value:
+        if target == low_value:
+            # Also covers low_value == high_value, so the division below is safe
+            return low
 
-        if arr[pos] == target:
+        pos = low + ((high - low) * (target - low_value) // 
+                    (high_value - low_value))
+        pos_value = arr[pos]
+
+        if pos_value == target:
             return pos
-        elif arr[pos] < target:
+        elif pos_value < target:
             low = pos + 1
+            low_value = arr[low]
         else:
             high = pos - 1
+            high_value = arr[high]
 
     return -1
 
@@ -59,31 +59,45 @@ def kmp_search(text: str, pattern: str) -> list:
         return []
 
     # First, let's get that LPS array (it's like a cheat sheet)
-    lps = compute_lps(pattern)
+    return _kmp_kernel(text, pattern, compute_lps(pattern))
+
+def _kmp_kernel(text, pattern, lps: list) -> list:
+    """
+    Scan text with a precomputed LPS array.
+
+    Walks the text exactly once with a for loop, so there is no text index
+    to maintain and len() is never called inside the loop. Works on any
+    sequence that compares element-wise (str, bytes, array).
+
+    Args:
+        text: Sequence to search in
+        pattern: Sequence to search for
+        lps (list): LPS array of pattern
+
+    Returns:
+        list: List of starting indices where pattern is found
+
+    Time Complexity: O(n) where n is text length
+    Space Complexity: O(1) besides the result list
+    """
     matches = []
-    
-    # Time to play hide and seek with our pattern
-    i = 0  # Text index (the hiding spot)
+    m = len(pattern)
     j = 0  # Pattern index (the seeker)
-    
-    while i < len(text):
-        if pattern[j] == text[i]:
+
+    # Time to play hide and seek with our pattern
+    for i, char in enumerate(text):
+        while j and pattern[j] != char:
+            # Mismatch! Back to the drawing board
+            j = lps[j - 1]
+
+        if pattern[j] == char:
             # They match! It's like finding matching socks
-            i += 1
             j += 1
-        
-        if j == len(pattern):
-            # Found the whole pattern! Achievement unlocked!
-            matches.append(i - j)
-            j = lps[j - 1]
-        
-        elif i < len(text) and pattern[j] != text[i]:
-            # Mismatch! Back to the drawing board
-            if j != 0:
+            if j == m:
+                # Found the whole pattern! Achievement unlocked!
+                matches.append(i - m + 1)
                 j = lps[j - 1]
-            else:
-                i += 1
-                
+
     return matches
 
 if __name__ == "__main__":
@@ -53,7 +53,8 @@ def manacher_algorithm(text: str) -> list:
             if length > 1:  # Skip single characters
                 results.append((start, length))
 
-    return sorted(results, key=lambda x: (-x[1], x[0]))
+    results.sort(key=lambda x: (-x[1], x[0]))  # In place, no second list
+    return results
 
 if __name__ == "__main__":
     # Test implementation
@@ -1,3 +1,8 @@
+import sys
+
+# Patterns this short are found faster by str.find than by rolling a hash
+SHORT_PATTERN_MAX = 64
+
 def rabin_karp_search(text: str, pattern: str, d: int = 256, q: int = 101) -> list:
     """
     Perform Rabin-Karp pattern searching algorithm using rolling hash.
@@ -11,6 +16,10 @@ def rabin_karp_search(text: str, pattern: str, d: int = 256, q: int = 101) -> li
     Returns:
         list: List of starting indices where pattern is found
 
+    Note:
+        The rolling hash only kicks in above SHORT_PATTERN_MAX characters;
+        below that, hashing costs more per character than str.find does.
+
     Time Complexity:
         - Average and Best Case: O(n + m)
         - Worst Case: O(nm)
@@ -27,6 +36,19 @@ def rabin_karp_search(text: str, pattern: str, d: int = 256, q: int = 101) -> li
     if M > N or M == 0 or N == 0:
         return results
 
+    if M <= SHORT_PATTERN_MAX:
+        i = text.find(pattern)
+        while i != -1:
+            results.append(i)
+            i = text.find(pattern, i + 1)
+        return results
+
+    # Code points of the text as plain ints (UTF-32 keeps indices aligned
+    # with the str), so the rolling hash doesn't call ord() per character.
+    # surrogatepass lets lone surrogates, which a str may hold, through too
+    codec = 'utf-32-le' if sys.byteorder == 'little' else 'utf-32-be'
+    text_codes = memoryview(text.encode(codec, 'surrogatepass')).cast('I')
+
     # Calculate hash value for pattern and first window
     pattern_hash = 0
     text_hash = 0
@@ -35,21 +57,20 @@ def rabin_karp_search(text: str, pattern: str, d: int = 256, q: int = 101) -> li
     # Calculate initial hash values like a responsible adult
     for i in range(M):
         pattern_hash = (d * pattern_hash + ord(pattern[i])) % q
-        text_hash = (d * text_hash + ord(text[i])) % q
+        text_hash = (d * text_hash + text_codes[i]) % q
 
     # Time to slide the pattern over text like butter on toast
     for i in range(N - M + 1):
         if pattern_hash == text_hash:
             # Hash match! But let's double-check (trust issues, you know?)
-            if text[i:i+M] == pattern:
+            if text.startswith(pattern, i):
                 results.append(i)
 
         if i < N - M:
             # Roll the hash forward, because that's how we roll
-            text_hash = (d * (text_hash - ord(text[i]) * h) + 
-                        ord(text[i + M])) % q
-            if text_hash < 0:
-                text_hash += q
+            # (Python's % is never negative for a positive q)
+            text_hash = (d * (text_hash - text_codes[i] * h) + 
+                        text_codes[i + M]) % q
 
     return results
 
@@ -66,3 +87,4 @@ if __name__ == "__main__":
     print("Empty pattern:", rabin_karp_search("ABC", ""))
     print("Single character:", rabin_karp_search("A", "A"))
     print("Pattern longer than text:", rabin_karp_search("ABC", "ABCD"))
+    print("Rolling hash path:", rabin_karp_search("xy" * 100 + "A" * 70, "A" * 64))
@@ -1,30 +1,262 @@
+# A one-off suffix array only pays for itself on patterns longer than this
+SHORT_PATTERN_MAX = 64
+
 def build_suffix_array(text: str) -> list:
     """
     Build suffix array for a given text.
 
+    Uses SA-IS (induced sorting), so no suffix is ever copied out of the text
+    and the whole construction is linear.
+
     Args:
         text (str): Text to build suffix array from
 
     Returns:
         list: Sorted list of suffix indices
 
-    Time Complexity: O(n log n) where n is text length
+    Time Complexity: O(n + k log k) where n is text length, k is number of distinct characters
     Space Complexity: O(n)
     """
-    # Create list of all suffixes and their starting indices
-    # (like collecting all possible endings of a story)
-    suffixes = [(text[i:], i) for i in range(len(text))]
-    
-    # Sort suffixes lexicographically (alphabetically, but fancier word)
-    suffixes.sort()
-    
-    # Return just the indices (because that's all we really need)
-    return [index for _, index in suffixes]
+    # Rank the characters so the alphabet is 0..k-1 (code point order is
+    # exactly how Python compares strings, so the suffix order is unchanged)
+    alphabet = sorted(set(text))
+    rank = {char: i for i, char in enumerate(alphabet)}
+    return _sa_is([rank[char] for char in text], len(alphabet) - 1)
+
+def _sa_is(s: list, upper: int) -> list:
+    """
+    Suffix array construction by induced sorting (Nong, Zhang & Chan).
+
+    Every position is typed S (suffix smaller than the next one) or L
+    (larger). The leftmost S positions of each S run (LMS positions) are
+    placed into their buckets, and from them the order of all L and then all
+    S suffixes is induced in two sweeps. If two LMS substrings turn out
+    identical, the LMS suffixes are renamed and sorted by recursing on the
+    shorter string, then the induction is run once more with the exact order.
+
+    Args:
+        s (list): String as a list of ints in the range 0..upper
+        upper (int): Largest value that can appear in s
+
+    Returns:
+        list: Sorted list of suffix indices of s
+
+    Time Complexity: O(n + upper)
+    Space Complexity: O(n + upper)
+    """
+    n = len(s)
+    if n == 0:
+        return []
+    if n == 1:
+        return [0]
+    if n == 2:
+        return [0, 1] if s[0] < s[1] else [1, 0]
+
+    # S/L typing, scanning right to left (the last suffix counts as L)
+    is_s = [False] * n
+    for i in range(n - 2, -1, -1):
+        is_s[i] = is_s[i + 1] if s[i] == s[i + 1] else s[i] < s[i + 1]
+
+    # Bucket boundaries: L suffixes fill a bucket from the front, S from the back
+    sum_l = [0] * (upper + 1)
+    sum_s = [0] * (upper + 1)
+    for i in range(n):
+        if is_s[i]:
+            sum_l[s[i] + 1] += 1  # An S character is never the largest one
+        else:
+            sum_s[s[i]] += 1
+    for c in range(upper + 1):
+        sum_s[c] += sum_l[c]
+        if c < upper:
+            sum_l[c + 1] += sum_s[c]
+
+    sa = [-1] * n
+
+    def induce(lms: list) -> None:
+        for i in range(n):
+            sa[i] = -1
+
+        bucket = sum_s[:]
+        for pos in lms:
+            sa[bucket[s[pos]]] = pos
+            bucket[s[pos]] += 1
+
+        # Left to right: every L suffix follows from the one after it
+        bucket = sum_l[:]
+        sa[bucket[s[n - 1]]] = n - 1
+        bucket[s[n - 1]] += 1
+        for i in range(n):
+            v = sa[i] - 1
+            if v >= 0 and not is_s[v]:
+                sa[bucket[s[v]]] = v
+                bucket[s[v]] += 1
+
+        # Right to left: same for S suffixes, filling buckets from the back
+        bucket = sum_l[:]
+        for i in range(n - 1, -1, -1):
+            v = sa[i] - 1
+            if v >= 0 and is_s[v]:
+                bucket[s[v] + 1] -= 1
+                sa[bucket[s[v] + 1]] = v
+
+    lms = [i for i in range(1, n) if not is_s[i - 1] and is_s[i]]
+    lms_index = [-1] * n
+    for i, pos in enumerate(lms):
+        lms_index[pos] = i
+    m = len(lms)
+
+    induce(lms)
+
+    if m:
+        sorted_lms = [pos for pos in sa if lms_index[pos] != -1]
+
+        # Name the LMS substrings, equal substrings share a name
+        names = [0] * m
+        name = 0
+        for i in range(1, m):
+            left, right = sorted_lms[i - 1], sorted_lms[i]
+            end_left = lms[lms_index[left] + 1] if lms_index[left] + 1 < m else n
+            end_right = lms[lms_index[right] + 1] if lms_index[right] + 1 < m else n
+
+            same = end_left - left == end_right - right
+            if same:
+                while left < end_left and s[left] == s[right]:
+                    left += 1
+                    right += 1
+                same = left != n and s[left] == s[right]
+
+            if not same:
+                name += 1
+            names[lms_index[sorted_lms[i]]] = name
+
+        # Names are not unique yet, so sort the LMS suffixes recursively
+        sub_sa = _sa_is(names, name)
+        induce([lms[i] for i in sub_sa])
+
+    return sa
+
+def build_lcp_array(text: str, suffix_array: list) -> list:
+    """
+    Build the LCP array of a suffix array using Kasai's algorithm.
+
+    lcp[i] is the length of the longest common prefix of the suffixes at
+    suffix_array[i - 1] and suffix_array[i] (lcp[0] is 0). Suffixes are
+    visited in text order, so the common prefix found for one suffix, minus
+    one, is a free head start for the next.
+
+    Args:
+        text (str): Text the suffix array was built from
+        suffix_array (list): Suffix array of text
+
+    Returns:
+        list: LCP array
+
+    Time Complexity: O(n) where n is text length
+    Space Complexity: O(n)
+    """
+    n = len(text)
+    rank = [0] * n
+    for i, start in enumerate(suffix_array):
+        rank[start] = i
+
+    lcp = [0] * n
+    common = 0
+    for start in range(n):
+        if rank[start] == 0:
+            common = 0
+            continue
+
+        previous = suffix_array[rank[start] - 1]
+        while (start + common < n and previous + common < n and
+               text[start + common] == text[previous + common]):
+            common += 1
+        lcp[rank[start]] = common
+
+        if common:
+            common -= 1  # Dropping the first character loses at most one match
+
+    return lcp
+
+class SuffixIndex:
+    """
+    Suffix array and LCP array of one text, built once and reused.
+
+    Building the arrays is the expensive part (O(n)), a query is only a
+    binary search (O(m log n)). Keep one of these around when the same text
+    gets searched for many patterns.
+
+    Time Complexity:
+        - Build: O(n) where n is text length
+        - Search: O(m log n + occ) where m is pattern length, occ is number of matches
+    Space Complexity: O(n)
+    """
+    def __init__(self, text: str):
+        self.text = text
+        # Build suffix array (our trusty search companion)
+        self.suffix_array = build_suffix_array(text)
+        self.lcp = build_lcp_array(text, self.suffix_array)
+
+    def search(self, pattern: str) -> list:
+        """
+        Find all occurrences of pattern in the indexed text.
+
+        Args:
+            pattern (str): Pattern to search for
+
+        Returns:
+            list: List of starting indices where pattern is found
+
+        Time Complexity: O(m log n + occ log occ)
+        Space Complexity: O(occ)
+        """
+        text = self.text
+        suffix_array = self.suffix_array
+        if not pattern or not text:
+            return []
+
+        # Binary search to find pattern (divide and conquer, like a boss)
+        # Suffixes are never sliced out of the text: startswith with an offset
+        # compares in place, and ordering only ever looks at m characters
+        m = len(pattern)
+        left = 0
+        right = len(text) - 1
+
+        while left <= right:
+            mid = (left + right) // 2
+            start = suffix_array[mid]
+
+            if text.startswith(pattern, start):
+                # Found one! Every sibling sits next to it in the suffix array,
+                # and the LCP array tells us how far the run goes without
+                # comparing a single character (cause they be nosey)
+                lcp = self.lcp
+
+                low = mid
+                while low > 0 and lcp[low] >= m:
+                    low -= 1
+
+                high = mid
+                while high + 1 < len(suffix_array) and lcp[high + 1] >= m:
+                    high += 1
+
+                return sorted(suffix_array[low:high + 1])
+
+            elif pattern < text[start:start + m]:
+                right = mid - 1
+            else:
+                left = mid + 1
+
+        return []
 
 def suffix_array_search(text: str, pattern: str) -> list:
     """
     Find all occurrences of pattern in text using suffix array.
 
+    Building a suffix array costs more than a plain str.find scan unless
+    the pattern is long, so patterns up to SHORT_PATTERN_MAX characters are
+    found with str.find and only longer ones get a one-off SuffixIndex. Use
+    SuffixIndex directly to search the same text more than once.
+
     Args:
         text (str): Text to search in
         pattern (str): Pattern to search for
@@ -32,7 +264,7 @@ def suffix_array_search(text: str, pattern: str) -> list:
     Returns:
         list: List of starting indices where pattern is found
 
-    Time Complexity: O(m log n) where n is text length, m is pattern length
+    Time Complexity: O(n + m log n) where n is text length, m is pattern length
     Space Complexity: O(n)
 
     Example:
@@ -42,41 +274,15 @@ def suffix_array_search(text: str, pattern: str) -> list:
     if not pattern or not text:
         return []
 
-    # Build suffix array (our trusty search companion)
-    suffix_array = build_suffix_array(text)
-    
-    # Binary search to find pattern (divide and conquer, like a boss)
-    left = 0
-    right = len(text) - 1
-    results = []
-
-    while left <= right:
-        mid = (left + right) // 2
-        suffix = text[suffix_array[mid]:]
-        
-        if suffix.startswith(pattern):
-            # Found one! Now let's find any siblings
-            results.append(suffix_array[mid])
-            
-            # Check neighbors (cause they be nosey)
-            i = mid - 1
-            while i >= 0 and text[suffix_array[i]:].startswith(pattern):
-                results.append(suffix_array[i])
-                i -= 1
-                
-            i = mid + 1
-            while i < len(suffix_array) and text[suffix_array[i]:].startswith(pattern):
-                results.append(suffix_array[i])
-                i += 1
-                
-            break
-            
-        elif pattern < suffix[:len(pattern)]:
-            right = mid - 1
-        else:
-            left = mid + 1
+    if len(pattern) <= SHORT_PATTERN_MAX:
+        results = []
+        i = text.find(pattern)
+        while i != -1:
+            results.append(i)
+            i = text.find(pattern, i + 1)
+        return results
 
-    return sorted(results)
+    return SuffixIndex(text).search(pattern)
 
 if __name__ == "__main__":
     text = "banana"
@@ -91,3 +297,8 @@ if __name__ == "__main__":
     print("Empty pattern:", suffix_array_search("abc", ""))
     print("Single character:", suffix_array_search("a", "a"))
     print("Pattern longer than text:", suffix_array_search("abc", "abcd"))
+
+    # Build once, search many times
+    index = SuffixIndex("mississippi")
+    for query in ("ssi", "i", "ppi", "x"):
+        print(f"'{query}' in 'mississippi':", index.search(query))
@@ -21,17 +21,21 @@ def ternary_search(arr: list, target: int) -> int|None:
 
     while left <= right:
         # Find two mid points or, you know, try at least.
-        mid1 = left + (right - left) // 3
-        mid2 = right - (right - left) // 3
+        third = (right - left) // 3
+        mid1 = left + third
+        mid2 = right - third
 
-        if arr[mid1] == target:
+        # Each probe is read once and kept in a local for all the compares
+        value1 = arr[mid1]
+        if value1 == target:
             return mid1
-        if arr[mid2] == target:
+        value2 = arr[mid2]
+        if value2 == target:
             return mid2
 
-        if target < arr[mid1]:
+        if target < value1:
             right = mid1 - 1
-        elif target > arr[mid2]:
+        elif target > value2:
             left = mid2 + 1
         else:
             left = mid1 + 1
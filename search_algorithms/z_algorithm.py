@@ -1,3 +1,6 @@
+# For patterns up to this long str.find finishes before the Z array would
+SHORT_PATTERN_MAX = 64
+
 def calculate_z_array(string: str) -> list:
     """
     Calculate Z array for pattern matching.
@@ -40,10 +43,45 @@ def calculate_z_array(string: str) -> list:
 
     return z
 
+class ZIndex:
+    """
+    Text kept around for repeated Z algorithm searches.
+
+    The Z array depends on the pattern as much as on the text, so there is
+    nothing text-side worth precomputing; this is the same search as
+    z_algorithm_search, behind the same interface as SuffixIndex.
+
+    Time Complexity:
+        - Build: O(1)
+        - Search: O(n + m) where n is text length, m is pattern length
+    Space Complexity: O(n + m) per search
+    """
+    def __init__(self, text: str):
+        self.text = text
+
+    def search(self, pattern: str) -> list:
+        """
+        Find all occurrences of pattern in the stored text.
+
+        Args:
+            pattern (str): Pattern to search for
+
+        Returns:
+            list: List of starting indices where pattern is found
+
+        Time Complexity: O(n + m)
+        Space Complexity: O(n + m)
+        """
+        return z_algorithm_search(self.text, pattern)
+
 def z_algorithm_search(text: str, pattern: str) -> list:
     """
     Find all occurrences of pattern in text using Z algorithm.
 
+    Short patterns (SHORT_PATTERN_MAX characters or fewer) never build a
+    Z array at all and go through str.find; only longer ones run the Z
+    algorithm on pattern + text.
+
     Args:
         text (str): Text to search in
         pattern (str): Pattern to search for
@@ -61,18 +99,23 @@ def z_algorithm_search(text: str, pattern: str) -> list:
     if not pattern or not text:
         return []
 
-    # Concatenate pattern and text with a character that won't appear in either
-    concat = pattern + "$" + text
-    z_array = calculate_z_array(concat)
-    results = []
+    if len(pattern) <= SHORT_PATTERN_MAX:
+        results = []
+        i = text.find(pattern)
+        while i != -1:
+            results.append(i)
+            i = text.find(pattern, i + 1)
+        return results
 
-    # Find pattern matches (the moment of truth)
+    # No separator between the two: a Z value of at least m at a position
+    # past the pattern means the pattern starts there, and no character
+    # (not even a "$" in the text) can fake a match
     pattern_length = len(pattern)
-    for i in range(len(concat)):
-        if z_array[i] == pattern_length:
-            results.append(i - pattern_length - 1)
+    z_array = calculate_z_array(pattern + text)
 
-    return [x for x in results if x >= 0]
+    # Find pattern matches (the moment of truth)
+    return [i - pattern_length for i in range(pattern_length, len(z_array))
+            if z_array[i] >= pattern_length]
 
 if __name__ == "__main__":
     # Test implementation
@@ -88,3 +131,8 @@ if __name__ == "__main__":
     print("Empty pattern:", z_algorithm_search("ABC", ""))
     print("Single character:", z_algorithm_search("A", "A"))
     print("Pattern longer than text:", z_algorithm_search("ABC", "ABCD"))
+
+    # Same search through the SuffixIndex-style interface
+    index = ZIndex(text)
+    for query in ("AA", "AAB", "CAAD"):
+        print(f"'{query}':", index.search(query))
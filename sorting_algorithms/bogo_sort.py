@@ -1,5 +1,11 @@
+from itertools import islice
+from operator import le
 import random
 
+# Print progress once every 2**20 shuffles, printing every attempt made the
+# stdout writes cost more than the shuffling itself
+PROGRESS_MASK = (1 << 20) - 1
+
 def is_sorted(values: list) -> bool:
     """
     Check if a list is sorted in ascending order.
@@ -19,10 +25,8 @@ def is_sorted(values: list) -> bool:
         >>> is_sorted([1, 3, 2, 4])
         False
     """
-    for index in range(len(values) - 1):
-        if values[index] > values[index + 1]:
-            return False
-    return True
+    # Pairwise compare of each element with its successor, all inside C
+    return all(map(le, values, islice(values, 1, None)))
 
 def bogo_sort(values: list) -> list:
     """
@@ -48,7 +52,8 @@ def bogo_sort(values: list) -> list:
     """
     attempts = 0
     while not is_sorted(values):
-        print(f"Attempt {attempts}")
+        if attempts & PROGRESS_MASK == 0 and attempts:
+            print(f"Attempt {attempts}")
         random.shuffle(values)
         attempts += 1
     return values
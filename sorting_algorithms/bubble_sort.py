@@ -8,24 +8,26 @@ def bubble_sort(values: list) -> list:
     Returns:
         list: The sorted list (modified in-place)
 
-    Time Complexity: O(n²) for all cases
+    Time Complexity: O(n²) worst and average case, O(n) when already sorted
     Space Complexity: O(1) as it sorts in-place
 
     Example:
         >>> bubble_sort([64, 34, 25, 12, 22, 11, 90])
         [11, 12, 22, 25, 34, 64, 90]
     """
-    n = len(values)
-    for i in range(n):
-        swapped = False
-        
-        for j in range(0, n - i - 1):
-            if values[j] > values[j + 1]:
-                values[j], values[j + 1] = values[j + 1], values[j]
-                swapped = True
-        
-        if not swapped:
-            break
+    # Everything past the last swap of a pass is already in place, so the
+    # next pass stops there. No swaps at all means end drops to 0 and we're done.
+    end = len(values) - 1
+    while end > 0:
+        last_swap = 0
+
+        for j in range(end):
+            left, right = values[j], values[j + 1]  # Read each slot once
+            if left > right:
+                values[j], values[j + 1] = right, left
+                last_swap = j
+
+        end = last_swap
     
     return values
 
@@ -1,3 +1,5 @@
+from itertools import chain
+
 def bucket_sort(values: list, bucket_size: int = 10) -> list:
     """
     Sort a list using the bucket sort algorithm.
@@ -32,14 +34,12 @@ def bucket_sort(values: list, bucket_size: int = 10) -> list:
         else:
             buckets[bucket_size - 1].append(value)
     
-    # Now the buckets can live in a sorted way
-    for i in range(bucket_size):
-        buckets[i] = sorted(buckets[i])
-    
-    # Concatenate all buckets into result array
-    result = []
+    # Now the buckets can live in a sorted way, in place, no copies
     for bucket in buckets:
-        result.extend(bucket)
+        bucket.sort()
+    
+    # Concatenate all buckets into result array in one C-level pass
+    result = list(chain.from_iterable(buckets))
     
     return result
 
@@ -19,32 +19,29 @@ def cocktail_sort(values: list) -> list:
         >>> cocktail_sort([64, 34, 25, 12, 22, 11, 90])
         [11, 12, 22, 25, 34, 64, 90]
     """
-    n = len(values)
-    swapped = True
+    # Everything outside [start, end] is already in its final place. Each pass
+    # pulls its bound in to where its last swap happened, so long sorted runs
+    # at either end are skipped instead of being compared again.
     start = 0
-    end = n - 1
-
-    while swapped:
-        swapped = False
+    end = len(values) - 1
 
+    while start < end:
         # Forward pass 
+        last_swap = start
         for i in range(start, end):
-            if values[i] > values[i + 1]:
-                values[i], values[i + 1] = values[i + 1], values[i]
-                swapped = True
-
-        if not swapped:
-            break
-
-        end -= 1
-        swapped = False
+            left, right = values[i], values[i + 1]  # Read each slot once
+            if left > right:
+                values[i], values[i + 1] = right, left
+                last_swap = i
+        end = last_swap
 
         # Backward pass
+        last_swap = end
         for i in range(end - 1, start - 1, -1):
-            if values[i] > values[i + 1]:
-                values[i], values[i + 1] = values[i + 1], values[i]
-                swapped = True
-
-        start += 1
+            left, right = values[i], values[i + 1]
+            if left > right:
+                values[i], values[i + 1] = right, left
+                last_swap = i + 1
+        start = last_swap
 
     return values
@@ -1,3 +1,5 @@
+from itertools import chain, compress, repeat
+
 def counting_sort(values: list) -> list:
     """
     Sort a list using the counting sort algorithm.
@@ -23,18 +25,17 @@ def counting_sort(values: list) -> list:
     range_of_elements = max_val - min_val + 1
 
     count = [0] * range_of_elements
-    output = [0] * len(values)
 
     # Store count of each object
-    for i in range(len(values)):
-        count[values[i] - min_val] += 1
-
-    for i in range(1, len(count)):
-        count[i] += count[i - 1]
+    for value in values:
+        count[value - min_val] += 1
 
-    for i in range(len(values) - 1, -1, -1):
-        output[count[values[i] - min_val] - 1] = values[i]
-        count[values[i] - min_val] -= 1
+    # Plain numbers have no identity to keep stable, so instead of a prefix
+    # sum and a scatter pass we just write each value out count times.
+    # compress and filter drop the empty slots first, so sparse ranges don't
+    # pay for a repeat() per slot; the whole output is still built in C.
+    present = compress(range(min_val, max_val + 1), count)
+    output = list(chain.from_iterable(map(repeat, present, filter(None, count))))
 
     return output
 
@@ -1,3 +1,5 @@
+import heapq
+
 def cube_sort(values: list) -> list:
     """
     Sort a list using the cube sort algorithm.
@@ -33,20 +35,10 @@ def cube_sort(values: list) -> list:
     for cube in cubes:
         cube.sort()
 
-    result = []
-    while any(cubes):
-        min_val = float('inf')
-        min_cube_index = 0
-        
-        # Finding the small guy
-        for i, cube in enumerate(cubes):
-            if cube and cube[0] < min_val:
-                min_val = cube[0]
-                min_cube_index = i
-        
-        result.append(cubes[min_cube_index].pop(0))
-        
-    return result
+    # Finding the small guy: heapq.merge keeps one head per cube in a heap,
+    # so each output element costs O(log k) instead of scanning every cube
+    # and pop(0) shifting the whole cube over
+    return list(heapq.merge(*cubes))
 
 def verify_sort(values: list) -> None:
     """
@@ -10,19 +10,28 @@ def heapify(arr: list, n: int, i: int) -> None:
     Time Complexity: O(log n)
     Space Complexity: O(1)
     """
-    largest = i
-    left = 2 * i + 1
-    right = 2 * i + 2
+    # Sift down with a loop instead of recursion: no call frame per level.
+    # The root value is held aside and bigger children move up into the
+    # hole, so it gets written once at its final spot instead of swapped
+    # at every level.
+    item = arr[i]
 
-    if left < n and arr[left] > arr[largest]:
-        largest = left
+    while True:
+        largest = 2 * i + 1  # Left child
+        if largest >= n:
+            break
 
-    if right < n and arr[right] > arr[largest]:
-        largest = right
+        right = largest + 1
+        if right < n and arr[right] > arr[largest]:
+            largest = right
 
-    if largest != i:
-        arr[i], arr[largest] = arr[largest], arr[i]
-        heapify(arr, n, largest)
+        if not arr[largest] > item:
+            break
+
+        arr[i] = arr[largest]
+        i = largest
+
+    arr[i] = item
 
 def heap_sort(values: list) -> list:
     """
@@ -1,3 +1,5 @@
+from bisect import bisect_right
+
 def insertion_sort(values: list) -> list:
     """
     Sort a list using the insertion sort algorithm.
@@ -8,7 +10,8 @@ def insertion_sort(values: list) -> list:
     Returns:
         list: The sorted list (modified in-place)
 
-    Time Complexity: O(n²) worst and average case, O(n) best case
+    Time Complexity: O(n²) moves worst and average case (done as memmoves),
+                     O(n log n) comparisons, O(n) moves best case
     Space Complexity: O(1) as it sorts in-place
 
     Example:
@@ -17,11 +20,13 @@ def insertion_sort(values: list) -> list:
     """
     for i in range(1, len(values)):
         key = values[i]
-        j = i - 1
-        while j >= 0 and values[j] > key:
-            values[j + 1] = values[j]
-            j -= 1
-        values[j + 1] = key
+        # Binary search for the slot (bisect_right keeps equal keys stable),
+        # then shift the block over with one slice assignment, which is a
+        # single memmove instead of one Python step per element
+        j = bisect_right(values, key, 0, i)
+        if j < i:
+            values[j + 1:i + 1] = values[j:i]
+            values[j] = key
     return values
 
 def verify_sort(values: list) -> None:
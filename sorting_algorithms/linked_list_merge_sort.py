@@ -58,8 +58,8 @@ def merge_sort(linked_list: LinkedList) -> LinkedList:
     Returns:
         LinkedList: A new sorted linked list
 
-    Time Complexity: O(kn log n) overall
-    Space Complexity: O(n)
+    Time Complexity: O(n log n) overall
+    Space Complexity: O(log n) for the recursion, nodes are relinked in place
 
     Example:
         >>> l = LinkedList()
@@ -69,70 +69,80 @@ def merge_sort(linked_list: LinkedList) -> LinkedList:
         >>> print(sorted_list)
         [Head: 1]->[Tail: 3]
     """
-    if linked_list.size() <= 1:
-        return linked_list
-    elif linked_list.head is None:
-        return linked_list
+    # Sort the nodes themselves and wrap the result up once at the top
+    sorted_list = LinkedList()
+    sorted_list.head = sort_nodes(linked_list.head)
+    return sorted_list
 
-    left_half, right_half = split(linked_list)
-    left = merge_sort(left_half)
-    right = merge_sort(right_half)
+def sort_nodes(head: Node) -> Node:
+    """
+    Merge sort a chain of nodes by relinking them.
+
+    Args:
+        head: First node of the chain, or None
 
-    return merge(left, right)
+    Returns:
+        Node: Head of the sorted chain
 
-def split(linked_list: LinkedList) -> tuple:
+    Time Complexity: O(n log n)
+    Space Complexity: O(log n) for the recursion
     """
-    Split the linked list at midpoint.
+    if head is None or head.next_node is None:
+        return head
 
-    Time Complexity: O(k log n)
-    Space Complexity: O(n)
+    left_head, right_head = split(head)
+    return merge(sort_nodes(left_head), sort_nodes(right_head))
+
+def split(head: Node) -> tuple:
     """
-    if linked_list is None or linked_list.head is None:
-        return linked_list, None
+    Split a chain of nodes at its midpoint.
 
-    size = linked_list.size()
-    mid = size // 2
-    mid_node = linked_list.node_at_index(mid-1)
+    The fast pointer moves two nodes for every one the slow pointer moves,
+    so when fast runs off the end slow is sitting on the middle. One walk,
+    no size() call and no second walk to reach the midpoint.
 
-    left_half = linked_list
-    right_half = LinkedList()
-    right_half.head = mid_node.next_node
-    mid_node.next_node = None
+    Time Complexity: O(n)
+    Space Complexity: O(1)
+    """
+    if head is None:
+        return None, None
 
-    return left_half, right_half
+    slow = head
+    fast = head.next_node
+    while fast and fast.next_node:
+        slow = slow.next_node
+        fast = fast.next_node.next_node
 
-def merge(left: LinkedList, right: LinkedList) -> LinkedList:
+    right_head = slow.next_node
+    slow.next_node = None
+
+    return head, right_head
+
+def merge(left: Node, right: Node) -> Node:
     """
-    Merge two sorted linked lists.
+    Merge two sorted chains of nodes.
+
+    Equal values keep their original order (the left one goes first).
 
     Time Complexity: O(n)
-    Space Complexity: O(n)
+    Space Complexity: O(1)
     """
-    merged = LinkedList()
-    merged.add(0)
-    current = merged.head
-    left_head = left.head
-    right_head = right.head
-
-    while left_head or right_head:
-        if left_head is None:
-            current.next_node = right_head
-            right_head = right_head.next_node
-        elif right_head is None:
-            current.next_node = left_head
-            left_head = left_head.next_node
+    dummy = Node(0)
+    current = dummy
+
+    while left and right:
+        if left.data <= right.data:
+            current.next_node = left
+            left = left.next_node
         else:
-            if left_head.data < right_head.data:
-                current.next_node = left_head
-                left_head = left_head.next_node
-            else:
-                current.next_node = right_head
-                right_head = right_head.next_node
+            current.next_node = right
+            right = right.next_node
         current = current.next_node
 
-    head = merged.head.next_node
-    merged.head = head
-    return merged
+    # Whatever is left over is already sorted, hook it on in one go
+    current.next_node = left if left else right
+
+    return dummy.next_node
 
 if __name__ == "__main__":
     # Test implementation
@@ -1,33 +1,111 @@
+from array import array
+from itertools import islice
+from operator import le
+
 def merge_sort(list: list) -> list:
     """
     Sort a list in ascending order using the merge sort algorithm.
 
+    An array.array comes back as a new array of the same typecode; both
+    buffers are then worked on through memoryviews, so the values never
+    get boxed into a list.
+
     Args:
-        list (list): The list to be sorted
+        list (list | array.array): The list to be sorted
 
     Returns:
-        list: A new sorted list
+        list | array.array: A new sorted list (or array, for array input)
 
     Time Complexity: O(n log n)
-    Space Complexity: O(n)
+    Space Complexity: O(n) for one scratch buffer
 
     Example:
         >>> merge_sort([98, 17, 2, 45])
         [2, 17, 45, 98]
+        >>> merge_sort(array('q', [98, 17, 2, 45]))
+        array('q', [2, 17, 45, 98])
 
     Process:
-        1. Divide: Find the midpoint of the list and divide into sublists
-        2. Conquer: Recursively sort the sublists created in previous step
-        3. Combine: Merge the sorted sublists created in previous step
+        Bottom-up, so no recursion and no sublists:
+        1. Treat every element as a sorted run of width 1
+        2. Merge neighbouring runs pairwise from one buffer into the other
+        3. Double the width and swap the buffers until one run is left
+    """
+    n = len(list)
+    # array.array keeps its typecode; anything else (tuple, range, ...)
+    # is copied into a plain list, since `list` is shadowed here
+    source = list[:] if isinstance(list, array) else [*list]
+    if n <= 1:
+        return source
+
+    # Same type as source, so runs slice-copy straight between the two
+    target = source[:]
+    if isinstance(source, array):
+        with memoryview(source) as source_view, memoryview(target) as target_view:
+            return _merge_passes(source_view, target_view, n).obj
+
+    return _merge_passes(source, target, n)
+
+def _merge_passes(source, target, n: int):
     """
-    if len(list) <= 1:
-        return list
+    Merge runs of doubling width back and forth between two buffers.
 
-    left_half, right_half = split(list)
-    left = merge_sort(left_half)
-    right = merge_sort(right_half)
+    Args:
+        source (list | memoryview): Buffer holding the unsorted values
+        target (list | memoryview): Scratch buffer of the same length and type
+        n (int): Number of values
 
-    return merge(left, right)
+    Returns:
+        list | memoryview: Whichever of the two buffers ends up sorted
+
+    Time Complexity: O(n log n)
+    Space Complexity: O(1) beyond the two buffers
+    """
+    width = 1
+    while width < n:
+        for start in range(0, n, 2 * width):
+            mid = min(start + width, n)
+            end = min(start + 2 * width, n)
+            _merge_runs(source, target, start, mid, end)
+        source, target = target, source
+        width *= 2
+
+    return source
+
+def _merge_runs(source: list, target: list, start: int, mid: int, end: int) -> None:
+    """
+    Merge source[start:mid] and source[mid:end] into target[start:end].
+
+    Equal elements keep their order (the left run wins ties), so the sort
+    is stable. Runs that are already in order (or a lone run without a
+    partner) are copied over whole, and once one run runs out the rest of
+    the other follows with a single slice assignment.
+
+    Time Complexity: O(end - start)
+    Space Complexity: O(1)
+    """
+    if mid == end or source[mid - 1] <= source[mid]:
+        target[start:end] = source[start:end]
+        return
+
+    # Each element is read exactly once, and the range() drives the write index
+    i, j = start, mid
+    left, right = source[i], source[j]
+    for k in range(start, end):
+        if left <= right:
+            target[k] = left
+            i += 1
+            if i == mid:
+                target[k + 1:end] = source[j:end]
+                return
+            left = source[i]
+        else:
+            target[k] = right
+            j += 1
+            if j == end:
+                target[k + 1:end] = source[i:mid]
+                return
+            right = source[j]
 
 def split(list: list) -> tuple:
     """
@@ -55,6 +133,8 @@ def merge(left: list, right: list) -> list:
     """
     Merge two lists, sorting them in the process.
 
+    Equal elements keep their order (left before right), so the merge is stable.
+
     Args:
         left (list): First sorted list
         right (list): Second sorted list
@@ -70,23 +150,24 @@ def merge(left: list, right: list) -> list:
         [1, 2, 3, 4]
     """
     merged = []
+    append = merged.append
+    left_len, right_len = len(left), len(right)
     i = j = 0
 
-    while i < len(left) and j < len(right):
-        if left[i] < right[j]:
-            merged.append(left[i])
+    # A plain branch on purpose: the interpreter pays for every extra
+    # bytecode, so arithmetic "branchless" tricks only slow this loop down
+    while i < left_len and j < right_len:
+        left_value, right_value = left[i], right[j]
+        if left_value <= right_value:
+            append(left_value)
             i += 1
         else:
-            merged.append(right[j])
+            append(right_value)
             j += 1
 
-    while i < len(left):
-        merged.append(left[i])
-        i += 1
-
-    while j < len(right):
-        merged.append(right[j])
-        j += 1
+    # One of these is empty - the other goes on in a single C-level copy
+    merged.extend(left[i:])
+    merged.extend(right[j:])
 
     return merged
 
@@ -101,16 +182,15 @@ def verify_sorted(list: list) -> bool:
         bool: True if sorted, False otherwise
 
     Time Complexity: O(n)
-    Space Complexity: O(n) due to recursion
+    Space Complexity: O(1)
 
     Example:
         >>> verify_sorted([1, 2, 3, 4])
         True
     """
-    n = len(list)
-    if n == 0 or n == 1:
-        return True
-    return list[0] <= list[1] and verify_sorted(list[1:])
+    # One pass comparing each element with its successor, no tail slices
+    # and no recursion limit
+    return all(map(le, list, islice(list, 1, None)))
 
 if __name__ == "__main__":
     # Test cases
@@ -127,3 +207,4 @@ if __name__ == "__main__":
     print("Single element:", merge_sort([1]))
     print("Two elements:", merge_sort([2, 1]))
     print("Duplicate elements:", merge_sort([3, 3, 3]))
+    print("Typed array:", merge_sort(array('q', [5, -1, 4, 2, 3])))
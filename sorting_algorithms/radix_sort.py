@@ -1,67 +1,87 @@
-def counting_sort_for_radix(arr: list, exp: int) -> None:
+from array import array
+from itertools import chain, repeat
+
+# Digits are bytes: a shift and a mask pick one out, no division needed
+RADIX_BITS = 8
+RADIX = 1 << RADIX_BITS
+DIGIT_MASK = RADIX - 1
+
+# Values below this fit in two bytes; if they are also dense, one counting
+# pass over the whole value is cheaper than two byte-sized digit passes
+NARROW_LIMIT = 1 << 16
+
+def counting_sort_for_radix(arr: list, shift: int) -> None:
     """
     Helper function for radix sort that sorts digits at a specific place value.
 
     Args:
         arr (list): The list to be sorted
-        exp (int): Place value (1, 10, 100, etc.)
+        shift (int): Bit position of the digit (0, 8, 16, etc.)
 
-    Time Complexity: O(n + k) where k is range of digits (10)
-    Space Complexity: O(n)
+    Time Complexity: O(n + k) where k is range of digits (256)
+    Space Complexity: O(n + k)
     """
-    n = len(arr)
-    output = [0] * n
-    count = [0] * 10
+    # Drop every value into the bucket of its digit, one pass, order kept
+    buckets = [[] for _ in range(RADIX)]
+    for value in arr:
+        buckets[value >> shift & DIGIT_MASK].append(value)
 
-    # How many times did this ish occur
-    for i in range(n):
-        index = arr[i] // exp
-        count[index % 10] += 1
-
-    for i in range(1, 10):
-        count[i] += count[i - 1]
-
-    # Gotta build an entire output array, but what do they do?
-    i = n - 1
-    while i >= 0:
-        index = arr[i] // exp
-        output[count[index % 10] - 1] = arr[i]
-        count[index % 10] -= 1
-        i -= 1
-
-    for i in range(n):
-        arr[i] = output[i]
+    # Lay the buckets back out in digit order, in one C-level slice assignment
+    arr[:] = chain.from_iterable(buckets)
 
 def radix_sort(values: list) -> list:
     """
     Sort a list using the radix sort algorithm.
 
+    An array.array of non-negative integers works too and comes back as
+    the same array, so callers can keep their numbers in a compact typed
+    buffer from start to finish.
+
     Args:
-        values (list): The list of numbers to be sorted
+        values (list | array.array): The numbers to be sorted
 
     Returns:
-        list: The sorted list (modified in-place)
+        list | array.array: The sorted values (modified in-place)
 
     Time Complexity: O(d * (n + k)) where:
         - n is the number of elements
-        - k is the range of each digit (10 for decimal)
-        - d is the number of digits in maximum element
+        - k is the range of each digit (256, one byte per digit)
+        - d is the number of bytes in maximum element
+        Dense 16-bit inputs (0 <= values < 65536 and max < n) take a single
+        counting pass instead of two digit passes.
     Space Complexity: O(n + k)
 
     Example:
         >>> radix_sort([170, 45, 75, 90, 802, 24, 2, 66])
         [2, 24, 45, 66, 75, 90, 170, 802]
+        >>> radix_sort(array('L', [170, 45, 75]))
+        array('L', [45, 75, 170])
     """
     if not values:
         return values
 
     max_num = max(values)
 
-    # Gotta do a counting sort for every digit...Ikr
-    exp = 1
-    while max_num // exp > 0:
-        counting_sort_for_radix(values, exp)
-        exp *= 10
+    # The digit passes shuffle a list; typed arrays get written back once at the end
+    work = values if isinstance(values, list) else list(values)
+
+    if RADIX <= max_num < NARROW_LIMIT and max_num < len(work) and min(work) >= 0:
+        # 16-bit values: treat the whole value as a single digit (a negative
+        # one would index the count table from the end, hence the min check)
+        counts = [0] * (max_num + 1)
+        for value in work:
+            counts[value] += 1
+        work[:] = chain.from_iterable(map(repeat, range(max_num + 1), counts))
+    else:
+        # Gotta do a counting sort for every digit...Ikr
+        # (base 256 needs 2.4x fewer passes than base 10)
+        shift = 0
+        while max_num >> shift > 0:
+            counting_sort_for_radix(work, shift)
+            shift += RADIX_BITS
+
+    if work is not values:
+        values[:] = array(values.typecode, work)
 
     return values
 
@@ -92,3 +112,4 @@ if __name__ == "__main__":
     print("Already sorted:", radix_sort([1, 2, 3, 4, 5]))
     print("Reverse sorted:", radix_sort([5, 4, 3, 2, 1]))
     print("Duplicate elements:", radix_sort([3, 3, 3, 1, 2, 2]))
+    print("Typed array:", radix_sort(array('L', [170, 45, 75, 90, 802])))
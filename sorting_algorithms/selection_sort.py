@@ -2,8 +2,6 @@
 Selection Sort
 """
 
-import sys
-
 def selection_sort(values: list) -> list:
     """
     Sort a list using the selection sort algorithm.
@@ -15,38 +13,46 @@ def selection_sort(values: list) -> list:
         list: A new sorted list containing all elements from the input list.
 
     Time Complexity: O(n²)
-    Space Complexity: O(n)
+    Space Complexity: O(n) for the copy
 
     Example:
         >>> selection_sort([64, 34, 25, 12, 22, 11, 90])
         [11, 12, 22, 25, 34, 64, 90]
     """
-    sorted_list = []
+    # Work on a copy so the caller's list is left alone
+    sorted_list = list(values)
     
-    for _ in range(len(values)):
-        index_to_move = index_of_min(values)
-        sorted_list.append(values.pop(index_to_move))
+    # Swap the smallest remaining value into place, no pop() shifting
+    for i in range(len(sorted_list) - 1):
+        index_to_move = index_of_min(sorted_list, i)
+        if index_to_move != i:
+            sorted_list[i], sorted_list[index_to_move] = sorted_list[index_to_move], sorted_list[i]
     
     return sorted_list
 
-def index_of_min(values: list) -> int:
+def index_of_min(values: list, start: int = 0) -> int:
     """
     Find the index of the minimum value in the list.
 
     Args:
         values (list): List to search through.
+        start (int): First index to consider.
 
     Returns:
-        int: Index of the minimum value in the list.
+        int: Index of the minimum value in values[start:] (the first one on ties),
+            or start if there is nothing to search.
 
     Example:
         >>> index_of_min([64, 34, 25, 12, 22])
         3
     """
-    min_index = 0
-    for i in range(1, len(values)):
-        if values[i] < values[min_index]:
+    # Keep the current minimum in a local so each step is one index and one compare
+    min_index = start
+    min_value = values[start] if start < len(values) else None
+    for i in range(start + 1, len(values)):
+        if values[i] < min_value:
             min_index = i
+            min_value = values[i]
     return min_index
 
 def verify_sort(values: list) -> None:
@@ -1,27 +1,69 @@
+from array import array
+
+# Ciura's experimentally best known gaps, ascending
+CIURA_GAPS = (1, 4, 10, 23, 57, 132, 301, 701)
+
 def shell_sort(values: list) -> list:
     """
-    Sort a list using the Shell sort algorithm with gap sequence n/2.
+    Sort a list using the Shell sort algorithm with Ciura's gap sequence.
+
+    The n/2, n/4, ... halving sequence is the worst of the classic choices
+    (it keeps comparing the same positions until gap 1). Ciura's gaps cut
+    the number of comparisons and moves noticeably; for lists longer than
+    the largest one the sequence is extended by a factor of 2.25.
+
+    An array.array (e.g. array('q', ...)) is sorted in place too, through
+    a memoryview, so the numbers stay 8-byte machine ints the whole time.
 
     Args:
-        values (list): The list of numbers to be sorted
+        values (list | array.array): The numbers to be sorted
 
     Returns:
-        list: The sorted list (modified in-place)
+        list | array.array: The sorted values (modified in-place)
 
     Time Complexity: 
         - Best case: O(n log n)
-        - Average case: O(n log n)
+        - Average case: not known analytically, roughly O(n^1.3) in practice
         - Worst case: O(n²)
     Space Complexity: O(1) as it sorts in-place
 
     Example:
         >>> shell_sort([64, 34, 25, 12, 22, 11, 90])
         [11, 12, 22, 25, 34, 64, 90]
+        >>> shell_sort(array('q', [3, 1, 2]))
+        array('q', [1, 2, 3])
+    """
+    n = len(values)
+
+    gaps = list(CIURA_GAPS)
+    while gaps[-1] < n:
+        gaps.append(int(gaps[-1] * 2.25))
+
+    if isinstance(values, array):
+        # Indexing a memoryview is a bit quicker than indexing the array itself
+        with memoryview(values) as view:
+            _gapped_insertion_sorts(view, gaps)
+    else:
+        _gapped_insertion_sorts(values, gaps)
+
+    return values
+
+def _gapped_insertion_sorts(values, gaps: list) -> None:
+    """
+    Run one gapped insertion sort per gap, largest gap first.
+
+    Args:
+        values (list | memoryview): The numbers to be sorted, in place
+        gaps (list): Ascending gap sequence, ending at or past len(values)
+
+    Time Complexity: Same as shell_sort
+    Space Complexity: O(1)
     """
     n = len(values)
-    gap = n // 2
+    for gap in reversed(gaps):
+        if gap >= n:
+            continue
 
-    while gap > 0:
         for i in range(gap, n):
             temp = values[i]
             j = i
@@ -31,9 +73,6 @@ def shell_sort(values: list) -> list:
                 j -= gap
 
             values[j] = temp
-        gap //= 2
-
-    return values
 
 def verify_sort(values: list) -> None:
     """
@@ -62,3 +101,4 @@ if __name__ == "__main__":
     print("Already sorted:", shell_sort([1, 2, 3, 4, 5]))
     print("Reverse sorted:", shell_sort([5, 4, 3, 2, 1]))
     print("Duplicate elements:", shell_sort([3, 3, 3, 1, 2, 2]))
+    print("Typed array:", shell_sort(array('q', [5, -1, 4, 2, 3])))
@@ -1,95 +1,285 @@
-def insertion_sort(arr: list, left: int, right: int) -> None:
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Optional
+
+MIN_GALLOP = 7
+
+def insertion_sort(arr: list, left: int, right: int, start: Optional[int] = None) -> None:
     """
-    Sort a small portion of the array using insertion sort.
+    Sort a small portion of the array using binary insertion sort.
+
+    Each element's slot is found with a binary search instead of a
+    backward scan, and the elements in the way are shifted with one slice
+    assignment (a single memmove) rather than one at a time.
 
     Args:
-        arr (list): Array to be sorted
+        arr (list | array.array): Array to be sorted
         left (int): Left boundary of subarray
         right (int): Right boundary of subarray
+        start (int, optional): First index not already known to be in
+            order; arr[left:start] is taken as sorted. Defaults to left + 1
 
-    Time Complexity: O(n²) worst case, O(n) for nearly sorted arrays
+    Time Complexity: O(n log n) comparisons, O(n²) element moves worst case
     Space Complexity: O(1)
     """
-    for i in range(left + 1, right + 1):
+    if start is None:
+        start = left + 1
+    for i in range(start, right + 1):
         key_item = arr[i]
-        j = i - 1
-        while j >= left and arr[j] > key_item:
-            arr[j + 1] = arr[j]
-            j -= 1
-        arr[j + 1] = key_item
+        # bisect_right keeps equal items in their original order
+        pos = bisect_right(arr, key_item, left, i)
+        if pos < i:
+            arr[pos + 1:i + 1] = arr[pos:i]
+            arr[pos] = key_item
 
-def merge(arr: list, l: int, m: int, r: int) -> None:
+def merge(arr: list, l: int, m: int, r: int, scratch: list) -> None:
     """
-    Merge two sorted subarrays.
+    Merge two sorted subarrays using a shared scratch buffer, galloping
+    when one side keeps winning.
+
+    Only the left run is copied out into scratch; the merge then writes
+    straight back into arr. The write position never overtakes the unread
+    part of the right run, so that half can stay where it is.
+
+    Once one run wins min_gallop comparisons in a row, the merge switches
+    to galloping mode: it binary searches for how far that run can go
+    before the other one is due and moves the whole block with a single
+    slice assignment. min_gallop shrinks while galloping pays off and
+    grows again when it does not, like CPython's list.sort.
 
     Args:
         arr (list): Array containing subarrays to merge
         l (int): Start of first subarray
         m (int): End of first subarray
         r (int): End of second subarray
+        scratch (list): Buffer at least as long as arr, reused across merges
 
-    Time Complexity: O(n)
-    Space Complexity: O(n)
+    Time Complexity: O(n), and O(k log(n / k)) comparisons when one run
+        is much shorter (length k) than the other
+    Space Complexity: O(1) extra (scratch is allocated once by the caller)
     """
-    left = arr[l:m + 1]
-    right = arr[m + 1:r + 1]
-    i = j = 0
+    scratch[l:m + 1] = arr[l:m + 1]
+    i = l
+    j = m + 1
     k = l
+    min_gallop = MIN_GALLOP
 
-    while i < len(left) and j < len(right):
-        if left[i] <= right[j]:
-            arr[k] = left[i]
-            i += 1
-        else:
-            arr[k] = right[j]
+    while i <= m and j <= r:
+        # One at a time, keeping score of who keeps winning
+        count_left = count_right = 0
+        while i <= m and j <= r:
+            if scratch[i] <= arr[j]:
+                arr[k] = scratch[i]
+                i += 1
+                count_left += 1
+                count_right = 0
+                if count_left >= min_gallop:
+                    k += 1
+                    break
+            else:
+                arr[k] = arr[j]
+                j += 1
+                count_right += 1
+                count_left = 0
+                if count_right >= min_gallop:
+                    k += 1
+                    break
+            k += 1
+
+        # Galloping mode - jump ahead in blocks while it keeps paying off
+        while i <= m and j <= r:
+            split = bisect_right(scratch, arr[j], i, m + 1)
+            count_left = split - i
+            arr[k:k + count_left] = scratch[i:split]
+            k += count_left
+            i = split
+            if i > m:
+                break
+            arr[k] = arr[j]
+            k += 1
             j += 1
-        k += 1
+            if j > r:
+                break
+
+            split = bisect_left(arr, scratch[i], j, r + 1)
+            count_right = split - j
+            arr[k:k + count_right] = arr[j:split]
+            k += count_right
+            j = split
+            if j > r:
+                break
+            arr[k] = scratch[i]
+            k += 1
+            i += 1
+
+            if count_left < MIN_GALLOP and count_right < MIN_GALLOP:
+                # Not worth it, back to the slow lane with a penalty
+                min_gallop += 2
+                break
+            min_gallop = max(1, min_gallop - 1)
+
+    # Whatever is left of the right run is already in place
+    if i <= m:
+        arr[k:k + m + 1 - i] = scratch[i:m + 1]
+
+def _compute_minrun(n: int) -> int:
+    """
+    Pick a minimum run length so that n / minrun is close to a power of two.
+
+    Takes the top 6 bits of n and adds one if any of the remaining bits are
+    set, which keeps the final merges balanced.
+
+    Args:
+        n (int): Length of the array
+
+    Returns:
+        int: Minimum run length (n itself when n < 64)
+
+    Time Complexity: O(log n)
+    Space Complexity: O(1)
+    """
+    r = 0
+    while n >= 64:
+        r |= n & 1
+        n >>= 1
+    return n + r
+
+def _count_run(arr: list, lo: int, hi: int) -> int:
+    """
+    Find the length of the natural run starting at lo.
+
+    A run is either non-decreasing or strictly decreasing. Decreasing runs
+    are reversed in place; strictness keeps the reversal stable.
 
-    while i < len(left):
-        arr[k] = left[i]
-        k += 1
-        i += 1
+    Args:
+        arr (list): Array being sorted
+        lo (int): Start of the run
+        hi (int): End of the region to scan (exclusive)
+
+    Returns:
+        int: Length of the run
+
+    Time Complexity: O(run length)
+    Space Complexity: O(1)
+    """
+    run_hi = lo + 1
+    if run_hi == hi:
+        return 1
+
+    if arr[run_hi] < arr[lo]:
+        # Strictly descending - flip it around once we know where it ends
+        while run_hi + 1 < hi and arr[run_hi + 1] < arr[run_hi]:
+            run_hi += 1
+        arr[lo:run_hi + 1] = arr[lo:run_hi + 1][::-1]
+    else:
+        while run_hi + 1 < hi and arr[run_hi + 1] >= arr[run_hi]:
+            run_hi += 1
 
-    while j < len(right):
-        arr[k] = right[j]
-        k += 1
-        j += 1
+    return run_hi + 1 - lo
+
+def _merge_at(arr: list, runs: list, i: int, scratch: list) -> None:
+    """
+    Merge the runs at stack positions i and i + 1 into one.
+
+    Args:
+        arr (list): Array being sorted
+        runs (list): Run stack of (start, length) pairs
+        i (int): Stack index of the first run
+        scratch (list): Shared merge buffer
+
+    Time Complexity: O(length of both runs)
+    Space Complexity: O(1) extra
+    """
+    start, length = runs[i]
+    _, next_length = runs[i + 1]
+    merge(arr, start, start + length - 1, start + length + next_length - 1, scratch)
+    runs[i] = (start, length + next_length)
+    del runs[i + 1]
+
+def _merge_collapse(arr: list, runs: list, scratch: list) -> None:
+    """
+    Merge runs until the stack invariants hold again.
+
+    For run lengths X, Y, Z from the top of the stack down, TimSort keeps
+    Z > Y + X and Y > X, so run lengths grow at least like Fibonacci
+    numbers and the stack stays O(log n) deep.
+
+    Args:
+        arr (list): Array being sorted
+        runs (list): Run stack of (start, length) pairs
+        scratch (list): Shared merge buffer
+
+    Time Complexity: O(n) amortised over the whole sort
+    Space Complexity: O(1) extra
+    """
+    while len(runs) > 1:
+        n = len(runs) - 2
+        if (n > 0 and runs[n - 1][1] <= runs[n][1] + runs[n + 1][1]) or \
+                (n > 1 and runs[n - 2][1] <= runs[n - 1][1] + runs[n][1]):
+            if runs[n - 1][1] < runs[n + 1][1]:
+                n -= 1
+        elif runs[n][1] > runs[n + 1][1]:
+            break
+        _merge_at(arr, runs, n, scratch)
 
 def timsort(arr: list) -> list:
     """
     Sort array using TimSort algorithm.
 
+    Natural runs (ascending, or strictly descending and then reversed) are
+    detected and extended to a minimum length with insertion sort, then
+    merged through a run stack that keeps TimSort's balance invariants.
+
+    Works in place on a list or on an array.array of numbers; the latter
+    keeps raw machine values instead of one Python object per element.
+
     Args:
-        arr (list): Array to be sorted
+        arr (list | array.array): Array to be sorted
 
     Returns:
-        list: Sorted array
+        list | array.array: The same array, sorted
 
     Time Complexity:
-        - Best case: O(n) for already sorted arrays
+        - Best case: O(n) for already sorted or reverse sorted arrays
         - Average/Worst case: O(n log n)
     Space Complexity: O(n)
 
     Example:
         >>> timsort([64, 34, 25, 12, 22, 11, 90])
         [11, 12, 22, 25, 34, 64, 90]
+        >>> timsort(array('q', [3, 1, 2]))
+        array('q', [1, 2, 3])
     """
-    min_run = 32
     n = len(arr)
+    if n < 2:
+        return arr
+
+    min_run = _compute_minrun(n)
+    # Same container type as arr, so slices copy straight between the two
+    scratch = arr[:]
+    runs = []
+
+    # Walk the array once, picking up natural runs as we go
+    lo = 0
+    while lo < n:
+        run_length = _count_run(arr, lo, n)
+
+        # Too short? Pad it out to min_run with insertion sort
+        if run_length < min_run:
+            forced = min(min_run, n - lo)
+            insertion_sort(arr, lo, lo + forced - 1, lo + run_length)
+            run_length = forced
 
-    # Create runs of minimum length
-    for i in range(0, n, min_run):
-        insertion_sort(arr, i, min((i + min_run - 1), n - 1))
+        runs.append((lo, run_length))
+        _merge_collapse(arr, runs, scratch)
+        lo += run_length
 
-    # Merge runs
-    size = min_run
-    while size < n:
-        for start in range(0, n, size * 2):
-            midpoint = start + size - 1
-            end = min((start + size * 2 - 1), (n - 1))
-            if midpoint < end:
-                merge(arr, start, midpoint, end)
-        size *= 2
+    # Merge whatever is still on the stack, top down
+    while len(runs) > 1:
+        i = len(runs) - 2
+        if i > 0 and runs[i - 1][1] < runs[i + 1][1]:
+            i -= 1
+        _merge_at(arr, runs, i, scratch)
 
     return arr
 
@@ -106,3 +296,4 @@ if __name__ == "__main__":
     print("Already sorted:", timsort([1, 2, 3, 4, 5]))
     print("Reverse sorted:", timsort([5, 4, 3, 2, 1]))
     print("Duplicate elements:", timsort([3, 3, 3, 1, 2, 2]))
+    print("Typed array:", timsort(array('q', [5, -1, 4, 2, 3])))
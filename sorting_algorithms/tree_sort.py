@@ -1,39 +1,83 @@
+import random
+
 class TreeNode:
     """
     Node in a Binary Search Tree used for Tree Sort.
 
+    Each node also carries a random priority, which turns the tree into a
+    treap: ordered by data like a BST, and heap-ordered by priority so the
+    shape stays balanced (in expectation) no matter the insertion order.
+
     Attributes:
         data: Value stored in the node
         left: Reference to left child
         right: Reference to right child
+        priority: Random heap key used to keep the tree balanced
 
     Time Complexity: O(1) for node creation
     Space Complexity: O(1)
     """
+    __slots__ = ('data', 'left', 'right', 'priority')
+
     def __init__(self, data):
         self.data = data
         self.left = None
         self.right = None
+        self.priority = random.random()
 
 def insert(root, data):
     """
-    Insert a new value into the BST.
+    Insert a new value into the BST, rotating it up to keep the tree balanced.
+
+    The value goes in as a leaf like in a plain BST, then gets rotated up
+    while its priority is smaller than its parent's. Rotations keep the
+    inorder sequence intact, and equal values still land after the ones
+    already in the tree, so the sort stays stable.
 
     Args:
         root: Current root node
         data: Value to insert
 
-    Time Complexity: O(log n) average, O(n) worst case
-    Space Complexity: O(log n) due to recursion
+    Returns:
+        TreeNode: Root of the tree (may change after rotations)
+
+    Time Complexity: O(log n) expected, for any insertion order
+    Space Complexity: O(log n) expected for the path back up
     """
+    node = TreeNode(data)
     if root is None:
-        return TreeNode(data)
-    
-    if data < root.data:
-        root.left = insert(root.left, data)
+        return node
+
+    # Walk down until we fall off the tree, then hang the node there
+    path = []
+    current = root
+    while current:
+        path.append(current)
+        current = current.left if data < current.data else current.right
+
+    parent = path[-1]
+    if data < parent.data:
+        parent.left = node
     else:
-        root.right = insert(root.right, data)
-    
+        parent.right = node
+
+    # Rotate the new node up until the heap order on priorities holds again
+    while path and path[-1].priority > node.priority:
+        parent = path.pop()
+        if parent.left is node:
+            parent.left = node.right
+            node.right = parent
+        else:
+            parent.right = node.left
+            node.left = parent
+
+        if not path:
+            root = node
+        elif path[-1].left is parent:
+            path[-1].left = node
+        else:
+            path[-1].right = node
+
     return root
 
 def inorder(root, result):
@@ -45,12 +89,18 @@ def inorder(root, result):
         result: List to store sorted values
 
     Time Complexity: O(n)
-    Space Complexity: O(n)
+    Space Complexity: O(h) for the explicit stack, where h is the tree height
     """
-    if root:
-        inorder(root.left, result)
-        result.append(root.data)
-        inorder(root.right, result)
+    stack = []
+    current = root
+    while stack or current:
+        # Go as far left as we can, remembering the way back
+        while current:
+            stack.append(current)
+            current = current.left
+        current = stack.pop()
+        result.append(current.data)
+        current = current.right
 
 def tree_sort(values: list) -> list:
     """
@@ -58,7 +108,8 @@ def tree_sort(values: list) -> list:
 
     Note:
         This is not a standalone sorting algorithm, but rather an application of two BST operations:
-        1. BST insertion: Creates a BST by inserting each element (O(log n) per insertion)
+        1. BST insertion: Creates a BST by inserting each element (O(log n) expected per
+           insertion, since the tree is a randomly balanced treap)
         2. Inorder traversal: Retrieves elements in sorted order (O(n))
 
     Args:
@@ -68,8 +119,8 @@ def tree_sort(values: list) -> list:
         list: Sorted list
 
     Time Complexity: 
-        - Average case: O(n log n)
-        - Worst case: O(n²) for unbalanced tree
+        - Expected: O(n log n) for any input order, sorted input included
+        - Worst case: O(n²), but only with vanishingly unlucky priorities
     Space Complexity: O(n)
 
     Example:
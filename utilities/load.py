@@ -1,3 +1,5 @@
+from pathlib import Path
+
 def load_numbers(file_name: str) -> list:
     """
     Load numbers from a file into a list.
@@ -17,11 +19,8 @@ def load_numbers(file_name: str) -> list:
         >>> print(numbers[:5])
         [1, 2, 3, 4, 5]
     """
-    numbers = []
-    with open(file_name) as f:
-        for line in f:
-            numbers.append(int(line))
-    return numbers
+    # One read, one split, and int() mapped over the lot - no Python-level loop
+    return list(map(int, _read_lines(file_name)))
 
 def load_strings(file_name: str) -> list:
     """
@@ -41,11 +40,29 @@ def load_strings(file_name: str) -> list:
         >>> print(strings[:3])
         ['apple', 'banana', 'cherry']
     """
-    strings = []
-    with open(file_name) as f:
-        for line in f:
-            strings.append(line.rstrip())
-    return strings
+    return list(map(str.rstrip, _read_lines(file_name)))
+
+def _read_lines(file_name: str) -> list:
+    """
+    Read a whole file and split it into lines the way iterating over it would.
+
+    Only newlines end a line (str.splitlines would also split on form
+    feeds, vertical tabs and the other Unicode line breaks), and a trailing
+    newline doesn't produce an extra empty line.
+
+    Args:
+        file_name (str): Path to the file
+
+    Returns:
+        list: Lines of the file without their line endings
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+    """
+    lines = Path(file_name).read_text().split('\n')
+    if lines[-1] == '':
+        lines.pop()
+    return lines
 
 # Test implementation
 if __name__ == "__main__":
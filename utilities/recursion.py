@@ -2,12 +2,16 @@
 Recursion
 """
 
-def sum(numbers: list) -> int:
+def sum(numbers: list, index: int = 0) -> int:
     """
     Calculate the sum of a list of numbers using recursion.
 
+    Each call works on the rest of the list starting at index, instead of
+    slicing off a new copy of the tail every time.
+
     Args:
         numbers (list): List of numbers to sum.
+        index (int): Where the part still to be summed starts.
 
     Returns:
         int: The sum of all numbers in the list.
@@ -19,13 +23,13 @@ def sum(numbers: list) -> int:
         >>> sum([1, 2, 3, 4])
         10
     """
-    if not numbers:
+    if index == len(numbers):
         return 0
     
-    remaining_sum = sum(numbers[1:])
-    total = numbers[0] + remaining_sum
+    remaining_sum = sum(numbers, index + 1)
+    total = numbers[index] + remaining_sum
     
-    print(f"Call to sum({numbers}) returning {numbers[0]} + {remaining_sum}")
+    print(f"Call to sum(numbers[{index}:]) returning {numbers[index]} + {remaining_sum}")
     return total
 
 if __name__ == "__main__":